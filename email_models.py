@@ -1,51 +1,75 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from copy import deepcopy
+import asyncio
+import re
+import time
+import weakref
+from dataclasses import dataclass
 from datetime import datetime
-from enum import StrEnum
-from typing import List, Optional, Union
+from functools import lru_cache
+from typing import Final, Iterable, List, Optional, Tuple, Union
 
+_ALLOWED_TLDS = frozenset({"com", "ru", "net"})
+_EMAIL_RE = re.compile(
+    rf"^[^@\s]+@[^@\s]+\.(?:{'|'.join(sorted(_ALLOWED_TLDS))})\Z"
+).match
 
-class Status(StrEnum):
-    DRAFT = "draft"
-    READY = "ready"
-    SENT = "sent"
-    FAILED = "failed"
-    INVALID = "invalid"
+
+class Status:
+    """Статусы письма — обычные строки, без накладных расходов Enum."""
+
+    DRAFT: Final[str] = "draft"
+    READY: Final[str] = "ready"
+    SENT: Final[str] = "sent"
+    FAILED: Final[str] = "failed"
+    INVALID: Final[str] = "invalid"
 
 
 class EmailAddress:
     """Класс-обёртка над email-адресом.
     Обеспечивает нормализацию, валидацию и маскированный вывод.
+    Экземпляры неизменяемы (__slots__, без сеттеров), поэтому один и тот же
+    объект можно безопасно разделять между письмами.
     """
 
+    __slots__ = ("_address", "_masked")
+
     def __init__(self, address: str):
         self._address = self._normalize(address)
         self._validate(self._address)
 
+        name, _, domain = self._address.partition("@")
+        self._masked = f"{name[:2]}***@{domain}"
+
+    @classmethod
+    def get(cls, address: str) -> EmailAddress:
+        """Возвращает закэшированный экземпляр для повторяющихся адресов.
+        Кэш ключуется по нормализованному адресу, поэтому " A@b.com" и
+        "a@b.com" дают один и тот же объект.
+        """
+        return cls._get_normalized(cls._normalize(address))
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _get_normalized(cls, address: str) -> EmailAddress:
+        return cls(address)
+
     @staticmethod
     def _normalize(address: str) -> str:
         return address.strip().lower()
 
     @staticmethod
     def _validate(address: str) -> None:
-        if "@" not in address:
+        if not _EMAIL_RE(address):
             raise ValueError(f"Invalid email: {address}")
 
-        domain_ok = any(address.endswith(tld) for tld in (".com", ".ru", ".net"))
-        if not domain_ok:
-            raise ValueError(f"Invalid email domain: {address}")
-
     @property
     def value(self) -> str:
         return self._address
 
     @property
     def masked(self) -> str:
-        name, domain = self._address.split("@")
-        prefix = name[:2]
-        return f"{prefix}***@{domain}"
+        return self._masked
 
     def __repr__(self) -> str:
         return self.value
@@ -54,7 +78,7 @@ class EmailAddress:
         return self.value
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class Email:
     subject: str
     body: str
@@ -62,14 +86,15 @@ class Email:
     recipients: Union[EmailAddress, List[EmailAddress]]
     date: Optional[datetime] = None
     short_body: Optional[str] = None
-    status: Status = Status.DRAFT
+    status: str = Status.DRAFT
 
     def __post_init__(self) -> None:
-        # recipients всегда должен быть списком
-        if isinstance(self.recipients, EmailAddress):
-            self.recipients = [self.recipients]
-        else:
-            self.recipients = list(self.recipients)
+        # recipients всегда должен быть списком; готовый список не копируем
+        recipients = self.recipients
+        if isinstance(recipients, EmailAddress):
+            self.recipients = [recipients]
+        elif not isinstance(recipients, list):
+            self.recipients = list(recipients)
 
     # ----------------------- PREPARE ------------------------
 
@@ -82,7 +107,12 @@ class Email:
         self._validate_fields()
 
     def add_short_body(self, limit: int = 20) -> None:
-        clean = " ".join(self.body.split())
+        # схлопываем пробелы только в начале тела; полный проход нужен,
+        # лишь если в этом срезе не набралось limit + 1 символа
+        head = self.body[: limit * 4]
+        clean = " ".join(head.split())
+        if len(clean) <= limit and len(self.body) > len(head):
+            clean = " ".join(self.body.split())
         self.short_body = clean[:limit] + ("..." if len(clean) > limit else "")
 
     def _validate_fields(self) -> None:
@@ -105,25 +135,110 @@ class Email:
         )
 
 
+def validate_bulk(addresses: Iterable[str]) -> List[bool]:
+    """Проверяет пачку адресов без создания объектов EmailAddress.
+    Правила нормализации и валидации те же, что и у EmailAddress.
+    Отдельный помощник: EmailService получает уже готовые адреса.
+    """
+    normalize = EmailAddress._normalize
+    return [_EMAIL_RE(normalize(address)) is not None for address in addresses]
+
+
 class EmailService:
     """Имитирует отправку. Для каждого получателя создаёт отдельное письмо."""
 
-    def send_email(self, email: Email) -> List[Email]:
-        result = []
+    POOL_MAX = 4096
 
-        for recipient in email.recipients:
-            new_email = deepcopy(email)
-            new_email.recipients = [recipient]
-            new_email.date = datetime.now()
+    def __init__(self) -> None:
+        # пул освобождённых писем для повторного использования в send_email
+        self._pool: List[Email] = []
+        # письма, выданные этим сервисом и ещё не возвращённые; слабые ссылки,
+        # чтобы невозвращённые письма спокойно собирались сборщиком мусора
+        self._issued: weakref.WeakValueDictionary[int, Email] = (
+            weakref.WeakValueDictionary()
+        )
 
-            if email.status == Status.READY:
-                new_email.status = Status.SENT
-            else:
-                new_email.status = Status.FAILED
+    def send_email(self, email: Email) -> List[Email]:
+        status = self._result_status(email)
+        return [
+            self._build_per_recipient(email, recipient, status)
+            for recipient in email.recipients
+        ]
+
+    def send_email_bulk(
+        self, email: Email
+    ) -> Tuple[List[str], List[str], List[datetime]]:
+        """Вариант send_email без создания писем: возвращает параллельные
+        списки адресов получателей, статусов и времени отправки.
+        """
+        n = len(email.recipients)
+        ts = datetime.now()
+        status = self._result_status(email)
+        return [r.value for r in email.recipients], [status] * n, [ts] * n
+
+    async def send_email_async(self, email: Email) -> List[Email]:
+        """Асинхронный вариант send_email: письма получателям формируются
+        параллельно, что пригодится для реального SMTP/HTTP-бэкенда.
+        """
+        status = self._result_status(email)
+        return await asyncio.gather(
+            *[
+                asyncio.to_thread(self._build_per_recipient, email, recipient, status)
+                for recipient in email.recipients
+            ]
+        )
 
-            result.append(new_email)
+    @staticmethod
+    def _result_status(email: Email) -> str:
+        """Статус, который получат все письма пачки."""
+        return Status.SENT if email.status == Status.READY else Status.FAILED
+
+    def _build_per_recipient(
+        self, email: Email, recipient: EmailAddress, status: str
+    ) -> Email:
+        # статус вычисляется один раз на пачку вызывающим; EmailAddress и
+        # строки неизменяемы, поэтому поля переиспользуются без копирования
+        new_email = self._acquire()
+        new_email.subject = email.subject
+        new_email.body = email.body
+        new_email.sender = email.sender
+        new_email.recipients = [recipient]
+        new_email.date = datetime.now()
+        new_email.short_body = email.short_body
+        new_email.status = status
+        return new_email
+
+    def release_batch(self, results: Iterable[Email]) -> None:
+        """Возвращает письма в пул; после вызова использовать их нельзя.
+        Письма, выданные не этим сервисом или уже возвращённые, игнорируются.
+        """
+        for email in results:
+            self._release(email)
+
+    def _acquire(self) -> Email:
+        """Берёт письмо из пула или создаёт пустое; поля заполняет вызывающий."""
+        # pop() атомарен, а проверка длины перед ним — нет
+        # (send_email_async вызывает это из нескольких потоков)
+        try:
+            email = self._pool.pop()
+        except IndexError:
+            email = Email.__new__(Email)
+        self._issued[id(email)] = email
+        return email
+
+    def _release(self, email: Email) -> None:
+        # чужие и уже возвращённые письма в пул не берём
+        if self._issued.pop(id(email), None) is not email:
+            return
 
-        return result
+        # не держим в пуле ссылки на тела писем и адреса
+        email.subject = email.body = email.short_body = None
+        email.sender = email.date = None
+        email.recipients = []
+        email.status = Status.DRAFT
+
+        if len(self._pool) < self.POOL_MAX:
+            self._pool.append(email)
 
 
 class LoggingEmailService(EmailService):
@@ -131,16 +246,67 @@ class LoggingEmailService(EmailService):
 
     LOG_FILE = "send.log"
 
-    def send_email(self, email: Email) -> List[Email]:
+    def __init__(self) -> None:
+        super().__init__()
+
+        # файл открывается один раз и остаётся открытым до close();
+        # если close() не вызвали, файл закроется при сборке сервиса
+        # сборщиком мусора или при выходе из интерпретатора
+        self._fp = open(self.LOG_FILE, "a", encoding="utf-8", buffering=8192)
+        self._finalizer = weakref.finalize(self, self._fp.close)
+
+        self._last_sec = -1
+        self._last_ts_str = ""
+
+    def close(self) -> None:
+        self._finalizer()
+
+    def __enter__(self) -> LoggingEmailService:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _timestamp(self) -> str:
+        """Отметка времени для лога; строка с секундами форматируется
+        заново только при смене секунды.
+        """
+        ts_ns = time.time_ns()
+        sec, ns = divmod(ts_ns, 1_000_000_000)
+        if sec != self._last_sec:
+            self._last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+            self._last_sec = sec
+        return f"{self._last_ts_str}.{ns // 1000:06d}"
+
+    def send_email(self, email: Email, flush: bool = True) -> List[Email]:
         results = super().send_email(email)
+        self._write_log(email, flush)
+        return results
 
-        with open(self.LOG_FILE, "a", encoding="utf-8") as file:
-            for msg in results:
-                file.write(
-                    f"{datetime.now()}: "
-                    f"FROM {email.sender.masked} "
-                    f"TO {msg.recipients[0].masked} "
-                    f"STATUS={msg.status.value}\n"
-                )
+    def send_email_bulk(
+        self, email: Email, flush: bool = True
+    ) -> Tuple[List[str], List[str], List[datetime]]:
+        result = super().send_email_bulk(email)
+        self._write_log(email, flush)
+        return result
 
+    async def send_email_async(self, email: Email, flush: bool = True) -> List[Email]:
+        results = await super().send_email_async(email)
+        # запись идёт в буфер файла в потоке цикла событий, поэтому
+        # строки разных пачек не перемешиваются
+        self._write_log(email, flush)
         return results
+
+    def _write_log(self, email: Email, flush: bool) -> None:
+        # по строке на получателя; отметка времени и статус общие для пачки
+        ts = self._timestamp()
+        sender_masked = email.sender.masked
+        status = self._result_status(email)
+        lines = [
+            f"{ts}: FROM {sender_masked} "
+            f"TO {recipient.masked} STATUS={status}\n"
+            for recipient in email.recipients
+        ]
+        self._fp.writelines(lines)
+        if flush:
+            self._fp.flush()
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from datetime import datetime
 
@@ -9,6 +10,7 @@ from email_models import (
     EmailService,
     LoggingEmailService,
     Status,
+    validate_bulk,
 )
 
 
@@ -30,6 +32,18 @@ class TestEmailAddress:
     def test_masked(self):
         addr = EmailAddress("alexander@example.com")
         assert addr.masked == "al***@example.com"
+        assert addr.masked is addr.masked
+
+    def test_get_returns_interned_instance(self):
+        first = EmailAddress.get("user@example.com")
+        second = EmailAddress.get("user@example.com")
+        assert first is second
+        assert first.value == "user@example.com"
+        assert EmailAddress.get("  USER@example.com ") is first
+
+    def test_validate_bulk(self):
+        result = validate_bulk(["  UsEr@Example.COM ", "invalid_email", "user@example.xyz"])
+        assert result == [True, False, False]
 
 
 # ---------------------- Email.prepare -------------------------
@@ -49,6 +63,20 @@ class TestEmailPrepare:
         assert email.status == Status.READY
         assert email.short_body.startswith("Test Body")
 
+    def test_short_body_collapses_whitespace_and_truncates(self):
+        email = Email(
+            subject="Subj",
+            body="one  two\n\tthree    four five six seven",
+            sender=EmailAddress("a@a.com"),
+            recipients=EmailAddress("b@b.com"),
+        )
+        email.prepare()
+        assert email.short_body == "one two three four f..."
+
+        email.body = "exactly twenty chars   "
+        email.add_short_body()
+        assert email.short_body == "exactly twenty chars"
+
     def test_prepare_invalid_when_empty_subject(self):
         email = Email(
             subject="",
@@ -119,6 +147,109 @@ class TestEmailService:
 
         assert result[0].status == Status.FAILED
 
+    def test_send_email_async_matches_send_email(self):
+        email = Email(
+            subject="Subj",
+            body="Body",
+            sender=EmailAddress("me@me.com"),
+            recipients=[EmailAddress("a@a.com"), EmailAddress("b@b.com")],
+        )
+        email.prepare()
+
+        service = EmailService()
+        result = asyncio.run(service.send_email_async(email))
+
+        assert [r.recipients[0].value for r in result] == ["a@a.com", "b@b.com"]
+        assert all(r.status == Status.SENT for r in result)
+
+    def test_send_email_bulk_returns_parallel_lists(self):
+        email = Email(
+            subject="Subj",
+            body="Body",
+            sender=EmailAddress("me@me.com"),
+            recipients=[EmailAddress("a@a.com"), EmailAddress("b@b.com")],
+        )
+        email.prepare()
+
+        recipients, statuses, dates = EmailService().send_email_bulk(email)
+
+        assert recipients == ["a@a.com", "b@b.com"]
+        assert statuses == [Status.SENT, Status.SENT]
+        assert len(dates) == 2 and all(isinstance(d, datetime) for d in dates)
+
+    def test_release_batch_reuses_emails(self):
+        email = Email(
+            subject="Subj",
+            body="Body",
+            sender=EmailAddress("me@me.com"),
+            recipients=EmailAddress("you@you.com"),
+        )
+        email.prepare()
+
+        service = EmailService()
+        first = service.send_email(email)
+        service.release_batch(first)
+        second = service.send_email(email)
+
+        assert second[0] is first[0]
+        assert second[0].recipients[0].value == "you@you.com"
+        assert second[0].status == Status.SENT
+
+    def test_release_batch_clears_fields(self):
+        email = Email(
+            subject="Subj",
+            body="Body",
+            sender=EmailAddress("me@me.com"),
+            recipients=EmailAddress("you@you.com"),
+        )
+        email.prepare()
+
+        service = EmailService()
+        result = service.send_email(email)
+        service.release_batch(result)
+
+        assert result[0].body is None
+        assert result[0].sender is None
+        assert result[0].recipients == []
+
+    def test_release_batch_ignores_double_and_foreign_release(self):
+        email = Email(
+            subject="Subj",
+            body="Body",
+            sender=EmailAddress("me@me.com"),
+            recipients=[EmailAddress("a@a.com"), EmailAddress("b@b.com")],
+        )
+        email.prepare()
+
+        service = EmailService()
+        first = service.send_email(email)
+        service.release_batch(first[:1])
+        service.release_batch(first[:1])
+        service.release_batch([email])
+
+        second = service.send_email(email)
+
+        assert second[0] is not second[1]
+        assert [r.recipients[0].value for r in second] == ["a@a.com", "b@b.com"]
+        assert all(r is not email for r in second)
+        assert [r.value for r in email.recipients] == ["a@a.com", "b@b.com"]
+
+    def test_release_batch_ignores_other_services_emails(self):
+        email = Email(
+            subject="Subj",
+            body="Body",
+            sender=EmailAddress("me@me.com"),
+            recipients=EmailAddress("you@you.com"),
+        )
+        email.prepare()
+
+        owner, other = EmailService(), EmailService()
+        result = owner.send_email(email)
+        other.release_batch(result)
+
+        assert other.send_email(email)[0] is not result[0]
+        assert result[0].recipients[0].value == "you@you.com"
+
     def test_original_email_unchanged(self):
         email = Email(
             subject="Subj",
@@ -135,6 +266,19 @@ class TestEmailService:
         assert email.status == Status.READY
         assert result[0].date is not None
 
+    def test_sender_shared_between_clones(self):
+        email = Email(
+            subject="Subj",
+            body="Body",
+            sender=EmailAddress("me@me.com"),
+            recipients=[EmailAddress("a@a.com"), EmailAddress("b@b.com")],
+        )
+        email.prepare()
+
+        result = EmailService().send_email(email)
+
+        assert all(r.sender is email.sender for r in result)
+
 
 # ---------------------- LoggingEmailService -------------------------
 
@@ -164,3 +308,22 @@ class TestLoggingEmailService:
             assert "FROM me***@me.com" in content
             assert "TO yo***@you.com" in content
             assert "STATUS=sent" in content
+
+    def test_logging_bulk_send_writes_line_per_recipient(self):
+        email = Email(
+            subject="Hello",
+            body="Body",
+            sender=EmailAddress("me@me.com"),
+            recipients=[EmailAddress("a@a.com"), EmailAddress("bob@b.com")],
+        )
+        email.prepare()
+
+        service = LoggingEmailService()
+        service.send_email_bulk(email)
+
+        with open(self.LOGFILE, "r", encoding="utf-8") as file:
+            lines = file.read().splitlines()
+
+        assert len(lines) == 2
+        assert "TO a***@a.com STATUS=sent" in lines[0]
+        assert "TO bo***@b.com STATUS=sent" in lines[1]